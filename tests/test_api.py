@@ -0,0 +1,34 @@
+"""Tests for the engine interface."""
+
+from tim_toolkit import TIMEngine
+
+
+CONTENTS = [
+    "A plain sentence.",
+    "I expected rain, but it was actually sunny.",
+    "Love is patient and patient is love, yes and no.",
+]
+
+
+def test_batch_classify_matches_score_expectation_breaks():
+    engine = TIMEngine()
+    rows = list(engine.batch_classify(c for c in CONTENTS))
+    
+    assert len(rows) == len(CONTENTS)
+    for content, row in zip(CONTENTS, rows):
+        scores = engine.classifier.score_expectation_breaks(content)
+        for key in ("break_count", "paradox_count", "reversal_count", "contrast_count"):
+            assert row[key] == scores[key]
+        assert row["word_count"] == len(content.split())
+
+
+def test_batch_classify_streams_rows():
+    engine = TIMEngine()
+    
+    def contents():
+        yield "I expected rain, but it was actually sunny."
+        raise AssertionError("read past the first document")
+    
+    row = next(engine.batch_classify(contents()))
+    
+    assert row["contrast_count"] == 1
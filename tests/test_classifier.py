@@ -0,0 +1,166 @@
+"""Tests for expectation break detection."""
+
+import re
+import time
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from tim_toolkit.classifier import BreakType, ExpectationBreakClassifier
+from tim_toolkit.context import ContentContext
+
+
+SAMPLES = [
+    "",
+    "A plain sentence with nothing unusual in it.",
+    "I expected rain, but it was actually sunny.",
+    "Surprisingly, the paradox is that less is more and more is less.",
+    "It is true and false, yes and no, because of course it can but cannot.",
+    "We assumed the plan worked. However the team truly knew it was broken.",
+    "Love is patient. Patient is love. Yet the story goes on though nobody asked.",
+]
+
+
+# The bounded-window regex that _find_contrasts replaces
+OLD_CONTRAST_PATTERN = re.compile(
+    r"(?:expected|assumed|thought|believed)\b.{0,120}?\b(?:but|however|yet|instead)\b"
+    r".{0,120}?\b(?:actually|really|truly)\b",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def _scaling(func, small, large):
+    """Best-of-three runtime ratio of func(large) to func(small)."""
+    def best(arg):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func(arg)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+    
+    return best(large) / best(small)
+
+
+@pytest.fixture
+def classifier():
+    return ExpectationBreakClassifier()
+
+
+@pytest.mark.parametrize("content", SAMPLES)
+def test_memoized_breaks_match_a_fresh_scan(classifier, content):
+    classifier.detect_breaks(content)
+    
+    assert classifier.detect_breaks(content) == list(classifier._scan_breaks(content))
+
+
+def test_detect_breaks_returns_a_new_list(classifier):
+    content = "I expected rain, but it was actually sunny."
+    first = classifier.detect_breaks(content)
+    first.clear()
+    
+    assert classifier.detect_breaks(content)
+    assert classifier.detect_breaks(content) is not classifier.detect_breaks(content)
+
+
+def test_cached_breaks_are_immutable(classifier):
+    breaks = classifier.detect_breaks("I expected rain, but it was actually sunny.")
+    
+    with pytest.raises(FrozenInstanceError):
+        breaks[0].confidence = 0.0
+
+
+def test_break_type_labels(classifier):
+    breaks = classifier.detect_breaks("I expected rain, but it was actually sunny.")
+    
+    assert {b.break_type for b in breaks} == {"contrast", "surprise_marker"}
+
+
+@pytest.mark.parametrize("content", SAMPLES)
+def test_score_counts_by_kind(classifier, content):
+    breaks = classifier.detect_breaks(content)
+    scores = classifier.score_expectation_breaks(content)
+    
+    assert scores["break_count"] == len(breaks)
+    for label in ("paradox", "reversal", "contrast"):
+        assert scores[f"{label}_count"] == sum(1 for b in breaks if b.break_type == label)
+
+
+@pytest.mark.parametrize("content", SAMPLES)
+def test_detect_breaks_sorted_by_position(classifier, content):
+    positions = [b.position for b in classifier.detect_breaks(content)]
+    
+    assert positions == sorted(positions)
+
+
+def test_classify_batch_counts_per_kind(classifier):
+    rows = list(classifier.classify_batch(SAMPLES))
+    
+    assert len(rows) == len(SAMPLES)
+    for content, row in zip(SAMPLES, rows):
+        breaks = classifier.detect_breaks(content)
+        expected = [sum(1 for b in breaks if b.kind == kind) for kind in BreakType]
+        assert row == expected + [len(breaks), len(content.split())]
+
+
+@pytest.mark.parametrize("content", SAMPLES)
+def test_count_breaks_matches_detect_breaks(classifier, content):
+    assert classifier.count_breaks(content) == len(classifier.detect_breaks(content))
+
+
+@pytest.mark.parametrize("content", SAMPLES + [
+    "expected but " * 50 + "actually",
+    "thought " + "x" * 121 + " but actually",
+    "believed but " + "y" * 121 + " truly",
+    "EXPECTED\nbut\nREALLY expected however truly",
+    "unexpected yet truly; expectedly but actually",
+])
+def test_find_contrasts_matches_regex(classifier, content):
+    expected = [(m.start(), m.end()) for m in OLD_CONTRAST_PATTERN.finditer(content)]
+    
+    assert classifier._find_contrasts(content) == expected
+
+
+def test_contrast_scan_scales_linearly(classifier):
+    # Every keyword group present, so the literal prescreen cannot skip it.
+    # Linear work gives a ratio near 4; quadratic work would give 16
+    ratio = _scaling(
+        classifier.count_breaks,
+        "expected but " * 5000 + "actually",
+        "expected but " * 20000 + "actually",
+    )
+    
+    assert ratio < 8
+
+
+def test_reversal_scan_scales_linearly_on_one_long_word(classifier):
+    ratio = _scaling(
+        classifier.count_breaks,
+        "a" * 50000 + " is b",
+        "a" * 200000 + " is b",
+    )
+    
+    assert ratio < 8
+
+
+def test_reversal_match_starts_at_word_boundary(classifier):
+    assert classifier.count_breaks("Love is pain, pain is love.") == 1
+    assert classifier.count_breaks("Glove is pain, pain is love.") == 0
+
+
+def test_surprise_density_rejects_mismatched_context(classifier):
+    context = ContentContext.from_content("Love is pain, pain is love.")
+    
+    with pytest.raises(ValueError):
+        classifier.calculate_surprise_density("Surprisingly short.", context=context)
+
+
+@pytest.mark.parametrize("content", ["Becauſe it rained.", "Love ıs pain, pain ıs love."])
+def test_screen_folds_like_ignorecase(classifier, content):
+    assert classifier.detect_breaks(content)
+    assert classifier.count_breaks(content) == len(classifier.detect_breaks(content))
+
+
+def test_per_pattern_attributes_are_kept(classifier):
+    assert [p.pattern for p in classifier.surprise_patterns] == classifier.SURPRISE_MARKERS
+    assert [p.pattern for p in classifier.paradox_patterns] == classifier.PARADOX_PATTERNS
@@ -0,0 +1,19 @@
+"""Tests for joke-to-song compilation."""
+
+import pytest
+
+from tim_toolkit.compiler import TIMCompiler
+
+
+@pytest.mark.parametrize("joke", [
+    "",
+    "A plain sentence.",
+    "I expected rain, but it was actually sunny.",
+    "Love is patient and patient is love, yes and no.",
+])
+def test_estimate_expansion_ratio(joke):
+    compiler = TIMCompiler()
+    breaks = compiler.classifier.detect_breaks(joke)
+    density = (len(breaks) / max(len(joke.split()), 1)) * 100
+    
+    assert compiler.estimate_expansion_ratio(joke) == 10.0 * (1.0 + density / 10.0)
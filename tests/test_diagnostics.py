@@ -0,0 +1,88 @@
+"""Tests for diagnostic reports."""
+
+import json
+
+import pytest
+
+from tim_toolkit.diagnostics import Diagnostic, DiagnosticLogger, DiagnosticValidator, Status
+
+
+@pytest.mark.parametrize("diagnostics, status", [
+    ([], Status.SUCCESS),
+    ([Diagnostic.COHERENCE_VERIFIED], Status.SUCCESS),
+    ([Diagnostic.EXPECTATION_BREAK], Status.UNSTABLE),
+    ([Diagnostic.COHERENCE_VERIFIED, Diagnostic.DECOHERENCE], Status.UNSTABLE),
+    ([Diagnostic.DECOHERENCE, Diagnostic.COERCION_DETECTED], Status.FAILED),
+])
+def test_determine_status(diagnostics, status):
+    assert DiagnosticValidator.determine_status(diagnostics) == status
+
+
+def test_determine_status_ignores_unknown_flags():
+    assert DiagnosticValidator.determine_status(["CoercionDetected"]) == Status.UNSTABLE
+
+
+def test_build_report_keeps_check_order():
+    report = DiagnosticValidator.build_report(
+        compression_ratio=0.3,
+        coherence_score=0.5,
+        breaks_detected=2,
+        coercion_detected=True,
+        semantic_surprise=True
+    )
+    
+    assert report.diagnostics == [
+        Diagnostic.COMPRESSION_RATIO_LOW,
+        Diagnostic.DECOHERENCE,
+        Diagnostic.COERCION_DETECTED,
+        Diagnostic.EXPECTATION_BREAK,
+        Diagnostic.SEMANTIC_SURPRISE,
+    ]
+    assert report.status == Status.FAILED
+
+def test_build_report_status_matches_determine_status():
+    for ratio in (0.3, 1.0, 3.0):
+        for coherence in (0.5, 0.7, 0.9):
+            for coercion in (False, True):
+                report = DiagnosticValidator.build_report(ratio, coherence, 1, coercion)
+                assert report.status == DiagnosticValidator.determine_status(report.diagnostics)
+
+
+def test_log_report():
+    report = DiagnosticValidator.build_report(1.0, 0.9, 0, False, metadata={"source": "joke"})
+    
+    assert DiagnosticLogger.log_report(report) == (
+        "Status: success\n"
+        "Compression Ratio: 1.00\n"
+        "Coherence Score: 0.90\n"
+        "Breaks Detected: 0\n"
+        "Coercion Detected: False\n"
+        "Diagnostics: CoherenceVerified\n"
+        "Metadata: {'source': 'joke'}"
+    )
+
+
+def test_to_json_matches_to_dict():
+    report = DiagnosticValidator.build_report(1.0, 0.9, 1, False, metadata={"source": "joke"})
+    
+    assert json.loads(report.to_json()) == report.to_dict()
+
+
+def test_to_json_without_orjson(monkeypatch):
+    import tim_toolkit.diagnostics as diagnostics
+    
+    report = DiagnosticValidator.build_report(1.0, 0.9, 1, False, metadata={"source": "joke"})
+    expected = report.to_json()
+    monkeypatch.setattr(diagnostics, "orjson", None)
+    
+    assert report.to_json() == expected
+
+
+def test_to_json_stringifies_non_str_keys(monkeypatch):
+    import tim_toolkit.diagnostics as diagnostics
+    
+    report = DiagnosticValidator.build_report(1.0, 0.9, 1, False, metadata={1: "a"})
+    
+    assert json.loads(report.to_json())["metadata"] == {"1": "a"}
+    monkeypatch.setattr(diagnostics, "orjson", None)
+    assert json.loads(report.to_json())["metadata"] == {"1": "a"}
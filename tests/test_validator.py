@@ -0,0 +1,118 @@
+"""Tests for non-coercion validation."""
+
+import re
+
+import pytest
+
+from tim_toolkit.context import ContentContext
+from tim_toolkit.validator import TIMValidator
+
+
+# The regex that _check_coherence's find/rfind check replaces
+OLD_CONTRADICTION_PATTERN = re.compile(
+    r"(?:true|real|correct).*?(?:false|fake|wrong)",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+@pytest.fixture
+def validator():
+    return TIMValidator()
+
+
+def test_validate_caches_into_context(validator):
+    content = "Only believers understand this."
+    context = ContentContext.from_content(content)
+    
+    result = validator.validate(content, context=context)
+    
+    assert context.validation == result
+    assert validator.validate(content, context=context) == result
+    assert validator.validate(content) == result
+
+
+def test_mismatched_context_is_rejected(validator):
+    context = ContentContext.from_content("Only believers understand this.")
+    
+    with pytest.raises(ValueError):
+        validator.validate("Consider this idea.", context=context)
+    with pytest.raises(ValueError):
+        validator.calculate_coercion_score("", context=context)
+
+
+@pytest.mark.parametrize("content", [
+    "Consider this idea if it resonates.",
+    "You must believe me. Act now!",
+])
+def test_scores_with_context_match_scores_without(validator, content):
+    context = ContentContext.from_content(content)
+    
+    assert validator.calculate_coercion_score(content, context) == validator.calculate_coercion_score(content)
+    assert validator.calculate_invitation_score(content, context) == validator.calculate_invitation_score(content)
+    assert validator.suggest_reframe(content, context) == validator.suggest_reframe(content)
+
+
+@pytest.mark.parametrize("content, violations", [
+    ("Consider this idea if it resonates.", []),
+    ("Only believers understand this.", [
+        "Coercive language detected: Only believe",
+        "Emotional manipulation detected: Only believers",
+    ]),
+    ("You must believe me. Act now!", [
+        "Coercive language detected: must believe",
+        "Pressure/urgency tactic detected: Act now",
+    ]),
+    ("Studies proven truth.", [
+        "Authority claim detected: proven truth",
+        "Authority claim detected: Studies prove",
+    ]),
+])
+def test_validate_reports_overlapping_terms(validator, content, violations):
+    is_valid, found = validator.validate(content)
+    
+    assert found == violations
+    assert is_valid == (not violations)
+
+
+@pytest.mark.parametrize("content", [
+    "",
+    "true",
+    "It is true that this is false.",
+    "False then true.",
+    "The REAL answer was\nWRONG.",
+    "correctness and wrongness",
+    "untrue statements are fake",
+    "truefalse",
+])
+def test_check_coherence_matches_regex(validator, content):
+    violations = validator._check_coherence(content)
+    
+    contradicts = OLD_CONTRADICTION_PATTERN.search(content) is not None
+    assert ("Potential contradiction detected" in violations) == contradicts
+
+
+@pytest.mark.parametrize("content", [
+    "Consider this idea if it resonates.",
+    "You must believe me. Act now!",
+    "Perhaps you might explore this, or not.",
+])
+def test_score_coercion_and_invitation(validator, content):
+    coercion, invitation = validator.score_coercion_and_invitation(content)
+    
+    assert coercion == validator.calculate_coercion_score(content)
+    assert invitation == validator.calculate_invitation_score(content)
+
+
+def test_screen_folds_like_ignorecase(validator):
+    is_valid, violations = validator.validate("The expert ſays so.")
+    
+    assert not is_valid
+    assert violations == ["Authority claim detected: expert ſays"]
+    assert validator._check_coherence("It is true, or falſe.") == ["Potential contradiction detected"]
+
+
+def test_per_term_attributes_are_kept(validator):
+    assert [p.pattern for p in validator.coercion_patterns] == validator.COERCION_TERMS
+    assert [p.pattern for p in validator.emotional_patterns] == validator.EMOTIONAL_MANIPULATION_TERMS
+    assert [p.pattern for p in validator.pressure_patterns] == validator.PRESSURE_TERMS
+    assert [p.pattern for p in validator.authority_patterns] == validator.AUTHORITY_TERMS
@@ -16,6 +16,7 @@ from .compiler import TIMCompiler
 from .classifier import ExpectationBreakClassifier
 from .validator import TIMValidator
 from .diagnostics import DiagnosticReport, DiagnosticValidator, DiagnosticLogger
+from .context import ContentContext
 
 __version__ = "1.0.0"
 __author__ = "TIM Toolkit Contributors"
@@ -33,4 +34,5 @@ __all__ = [
     "DiagnosticReport",
     "DiagnosticValidator",
     "DiagnosticLogger",
+    "ContentContext",
 ]
@@ -4,18 +4,40 @@ Detects expectation breaks and semantic surprises in content.
 """
 
 import re
-from typing import List, Dict, Optional
+from enum import IntEnum
+from bisect import bisect_left
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 from dataclasses import dataclass
+from .context import ContentContext, fold_case
 
 
-@dataclass
+class BreakType(IntEnum):
+    """Expectation break kinds; values double as per-kind counter indices."""
+    SURPRISE = 0
+    PARADOX = 1
+    REVERSAL = 2
+    CONTRAST = 3
+
+
+# Public string labels, indexed by BreakType
+_BREAK_TYPE_LABELS = ("surprise_marker", "paradox", "reversal", "contrast")
+
+
+@dataclass(slots=True, frozen=True)
 class ExpectationBreak:
     """Represents a detected expectation break."""
-    break_type: str
+    kind: BreakType
     position: int
     content: str
     confidence: float
     explanation: str
+    
+    @property
+    def break_type(self) -> str:
+        """String label of the break kind, as reported by the API."""
+        return _BREAK_TYPE_LABELS[self.kind]
 
 
 class ExpectationBreakClassifier:
@@ -53,10 +75,59 @@ class ExpectationBreakClassifier:
         r"(?:yes|no)\s+(?:and|but|yet)\s+(?:no|yes)",
     ]
     
+    # Patterns below are compiled once at import and shared by every instance.
+    # One named alternation per pattern family, so content is scanned once
+    _combined_surprise = re.compile(
+        "|".join(f"(?P<m{i}>{p})" for i, p in enumerate(SURPRISE_MARKERS)),
+        re.IGNORECASE
+    )
+    _combined_paradox = re.compile(
+        "|".join(f"(?P<m{i}>{p})" for i, p in enumerate(PARADOX_PATTERNS)),
+        re.IGNORECASE
+    )
+    
+    # Per-pattern forms, no longer used for detection; kept for callers
+    # that read them off the instance
+    surprise_patterns = tuple(re.compile(p, re.IGNORECASE) for p in SURPRISE_MARKERS)
+    paradox_patterns = tuple(re.compile(p, re.IGNORECASE) for p in PARADOX_PATTERNS)
+    
+    # Literal substrings every match must contain; checked before the regex scan
+    _surprise_anchors = (
+        "because", "but", "actually", "instead", "paradox",
+        "contradiction", "however", "yet", "though", "despite",
+    )
+    _paradox_anchors = ("and", "but", "yet")
+    _reversal_anchors = ("is", "was")
+    # A contrast needs one word from each group, in order
+    _contrast_anchors = (
+        ("expected", "assumed", "thought", "believed"),
+        ("but", "however", "yet", "instead"),
+        ("actually", "really", "truly"),
+    )
+    
+    # Bounded window keeps the reversal scan near-linear on long content.
+    # Every run in the pattern is followed by a disjoint class,
+    # so possessive quantifiers drop backtrack states without changing matches.
+    # The leading \b starts each match at a word boundary; otherwise every
+    # offset inside one long word is retried and the scan turns quadratic.
+    _reversal_pattern = re.compile(
+        r"\b(\w++)\s++(?:is|was)\s++(\w++)(?:\W++\w++){0,30}?\W++\2\s++(?:is|was)\s++\1",
+        re.IGNORECASE
+    )
+    
+    # A contrast is "<expected> ... <but> ... <actually>", each gap at most
+    # _CONTRAST_WINDOW chars. The keywords are located separately and joined
+    # in _find_contrasts, so the cost stays linear however many keywords
+    # the content repeats.
+    _CONTRAST_WINDOW = 120
+    _contrast_openers = re.compile(r"(?=(expected|assumed|thought|believed)\b)", re.IGNORECASE)
+    _contrast_turns = re.compile(r"\b(?:but|however|yet|instead)\b", re.IGNORECASE)
+    _contrast_reveals = re.compile(r"\b(?:actually|really|truly)\b", re.IGNORECASE)
+    
     def __init__(self):
         """Initialize classifier."""
-        self.surprise_patterns = [re.compile(p, re.IGNORECASE) for p in self.SURPRISE_MARKERS]
-        self.paradox_patterns = [re.compile(p, re.IGNORECASE) for p in self.PARADOX_PATTERNS]
+        # Per-instance memo so chained scoring calls scan each content once
+        self._detect_breaks_cached = lru_cache(maxsize=256)(self._scan_breaks)
     
     def detect_breaks(self, content: str) -> List[ExpectationBreak]:
         """
@@ -64,13 +135,60 @@ class ExpectationBreakClassifier:
         
         Returns list of detected breaks with confidence scores.
         """
+        return list(self._detect_breaks_cached(content))
+    
+    def classify_batch(self, contents: Iterable[str]) -> Iterator[List[int]]:
+        """
+        Count expectation breaks for many documents at once.
+        
+        Runs the same detectors as detect_breaks but only counts matches,
+        without building ExpectationBreak objects. Rows are yielded as each
+        document is read, so a generator of documents is never held in
+        memory. Each row is:
+        [surprise, paradox, reversal, contrast, break_count, word_count].
+        """
+        for content in contents:
+            counts = self._count_by_kind(content)
+            yield counts + [sum(counts), len(content.split())]
+    
+    def count_breaks(self, content: str) -> int:
+        """
+        Count expectation breaks in content.
+        
+        Same total as len(detect_breaks(content)), without building
+        ExpectationBreak objects.
+        """
+        return sum(self._count_by_kind(content))
+    
+    def _count_by_kind(self, content: str) -> List[int]:
+        """Count detector matches per BreakType without materializing breaks."""
+        surprise, paradox, reversal, contrast = self._screen(fold_case(content))
+        counts = [0] * len(BreakType)
+        
+        if surprise:
+            counts[BreakType.SURPRISE] = sum(1 for _ in self._combined_surprise.finditer(content))
+        
+        if paradox:
+            counts[BreakType.PARADOX] = sum(1 for _ in self._combined_paradox.finditer(content))
+        
+        if reversal:
+            counts[BreakType.REVERSAL] = sum(1 for _ in self._reversal_pattern.finditer(content))
+        
+        if contrast:
+            counts[BreakType.CONTRAST] = len(self._find_contrasts(content))
+        
+        return counts
+    
+    def _scan_breaks(self, content: str) -> Tuple[ExpectationBreak, ...]:
+        """Run every break detector over content, sorted by position."""
         breaks = []
+        surprise, paradox, reversal, contrast = self._screen(fold_case(content))
         
         # Detect surprise markers
-        for pattern in self.surprise_patterns:
-            for match in pattern.finditer(content):
+        if surprise:
+            for match in self._combined_surprise.finditer(content):
                 breaks.append(ExpectationBreak(
-                    break_type="surprise_marker",
+                    kind=BreakType.SURPRISE,
                     position=match.start(),
                     content=match.group(),
                     confidence=0.7,
@@ -78,10 +196,10 @@ class ExpectationBreakClassifier:
                 ))
         
         # Detect paradoxes
-        for pattern in self.paradox_patterns:
-            for match in pattern.finditer(content):
+        if paradox:
+            for match in self._combined_paradox.finditer(content):
                 breaks.append(ExpectationBreak(
-                    break_type="paradox",
+                    kind=BreakType.PARADOX,
                     position=match.start(),
                     content=match.group(),
                     confidence=0.9,
@@ -89,31 +207,42 @@ class ExpectationBreakClassifier:
                 ))
         
         # Detect reversals
-        reversals = self._detect_reversals(content)
-        breaks.extend(reversals)
+        if reversal:
+            reversals = self._detect_reversals(content)
+            breaks.extend(reversals)
         
         # Detect contrasts
-        contrasts = self._detect_contrasts(content)
-        breaks.extend(contrasts)
+        if contrast:
+            contrasts = self._detect_contrasts(content)
+            breaks.extend(contrasts)
         
-        # Sort by position
-        breaks.sort(key=lambda b: b.position)
+        # Sort by position; each detector's output is already an ascending
+        # run, which the sort merges rather than re-sorting element by element
+        breaks.sort(key=attrgetter("position"))
         
-        return breaks
+        return tuple(breaks)
+    
+    def _screen(self, lowered: str) -> Tuple[bool, bool, bool, bool]:
+        """
+        Report which detectors can match, from literal anchors alone.
+        
+        Returns flags in BreakType order: (surprise, paradox, reversal, contrast).
+        """
+        return (
+            any(a in lowered for a in self._surprise_anchors),
+            any(a in lowered for a in self._paradox_anchors),
+            any(a in lowered for a in self._reversal_anchors),
+            all(any(a in lowered for a in group) for group in self._contrast_anchors),
+        )
     
     def _detect_reversals(self, content: str) -> List[ExpectationBreak]:
         """Detect subject-object or value reversals."""
         breaks = []
         
         # Look for patterns like "X is Y" followed by "Y is X"
-        reversal_pattern = re.compile(
-            r"(\w+)\s+(?:is|was)\s+(\w+).*?(\2)\s+(?:is|was)\s+(\1)",
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        for match in reversal_pattern.finditer(content):
+        for match in self._reversal_pattern.finditer(content):
             breaks.append(ExpectationBreak(
-                break_type="reversal",
+                kind=BreakType.REVERSAL,
                 position=match.start(),
                 content=match.group(),
                 confidence=0.85,
@@ -126,34 +255,69 @@ class ExpectationBreakClassifier:
         """Detect contrast patterns."""
         breaks = []
         
-        contrast_pattern = re.compile(
-            r"(?:expected|assumed|thought|believed).*?(?:but|however|yet|instead).*?(?:actually|really|truly)",
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        for match in contrast_pattern.finditer(content):
+        for start, end in self._find_contrasts(content):
+            text = content[start:end]
             breaks.append(ExpectationBreak(
-                break_type="contrast",
-                position=match.start(),
-                content=match.group(),
+                kind=BreakType.CONTRAST,
+                position=start,
+                content=text,
                 confidence=0.8,
-                explanation=f"Expectation contrast: {match.group()[:50]}..."
+                explanation=f"Expectation contrast: {text[:50]}..."
             ))
         
         return breaks
     
-    def calculate_surprise_density(self, content: str) -> float:
+    def _find_contrasts(self, content: str) -> List[Tuple[int, int]]:
+        """
+        Return (start, end) spans of non-overlapping contrasts.
+        
+        Spans are those of a lazy, bounded-window regex scan: each opener
+        takes the first turn within the window that has a reveal within
+        the window after it, and ends at that first reveal.
+        """
+        window = self._CONTRAST_WINDOW
+        reveals = [(m.start(), m.end()) for m in self._contrast_reveals.finditer(content)]
+        reveal_starts = [start for start, _ in reveals]
+        
+        # Turns with a reveal close enough behind them, with that reveal's end
+        turn_starts = []
+        turn_reveal_ends = []
+        for match in self._contrast_turns.finditer(content):
+            i = bisect_left(reveal_starts, match.end())
+            if i < len(reveals) and reveal_starts[i] - match.end() <= window:
+                turn_starts.append(match.start())
+                turn_reveal_ends.append(reveals[i][1])
+        
+        spans = []
+        last_end = 0
+        for match in self._contrast_openers.finditer(content):
+            start = match.start()
+            if start < last_end:
+                continue
+            
+            opener_end = match.end(1)
+            i = bisect_left(turn_starts, opener_end)
+            if i < len(turn_starts) and turn_starts[i] - opener_end <= window:
+                last_end = turn_reveal_ends[i]
+                spans.append((start, last_end))
+        
+        return spans
+    
+    def calculate_surprise_density(self, content: str, context: Optional[ContentContext] = None) -> float:
         """
         Calculate surprise density (0.0 to 1.0).
         
         Higher density = more expectation breaks per word.
         """
-        breaks = self.detect_breaks(content)
+        if context is not None:
+            context.check(content)
+        
+        breaks = self._detect_breaks_cached(content)
         
         if not breaks:
             return 0.0
         
-        word_count = len(content.split())
+        word_count = context.word_count if context is not None else len(content.split())
         break_count = len(breaks)
         
         # Normalize to 0-1 range
@@ -167,23 +331,23 @@ class ExpectationBreakClassifier:
         
         Based on break patterns and density.
         """
-        breaks = self.detect_breaks(content)
+        breaks = self._detect_breaks_cached(content)
         
         if not breaks:
             return "straightforward"
         
-        break_types = [b.break_type for b in breaks]
+        counts, _ = self._tally(breaks)
         
-        if "paradox" in break_types:
+        if counts[BreakType.PARADOX]:
             return "paradox"
         
-        if "reversal" in break_types:
+        if counts[BreakType.REVERSAL]:
             return "reversal"
         
-        if len([b for b in breaks if b.break_type == "surprise_marker"]) > 2:
+        if counts[BreakType.SURPRISE] > 2:
             return "joke"
         
-        if "contrast" in break_types:
+        if counts[BreakType.CONTRAST]:
             return "contrast_narrative"
         
         return "semantic_surprise"
@@ -194,7 +358,7 @@ class ExpectationBreakClassifier:
         
         Usually found after the primary expectation break.
         """
-        breaks = self.detect_breaks(content)
+        breaks = self._detect_breaks_cached(content)
         
         if not breaks:
             return None
@@ -219,18 +383,31 @@ class ExpectationBreakClassifier:
         
         Returns dict with scores for different break characteristics.
         """
-        breaks = self.detect_breaks(content)
+        breaks = self._detect_breaks_cached(content)
+        counts, confidence_sum = self._tally(breaks)
         
         scores = {
             "surprise_density": self.calculate_surprise_density(content),
             "break_count": len(breaks),
-            "average_confidence": sum(b.confidence for b in breaks) / len(breaks) if breaks else 0.0,
-            "paradox_count": len([b for b in breaks if b.break_type == "paradox"]),
-            "reversal_count": len([b for b in breaks if b.break_type == "reversal"]),
-            "contrast_count": len([b for b in breaks if b.break_type == "contrast"]),
+            "average_confidence": confidence_sum / len(breaks) if breaks else 0.0,
+            "paradox_count": counts[BreakType.PARADOX],
+            "reversal_count": counts[BreakType.REVERSAL],
+            "contrast_count": counts[BreakType.CONTRAST],
         }
         
         return scores
+    
+    @staticmethod
+    def _tally(breaks) -> Tuple[List[int], float]:
+        """Count breaks per kind and sum their confidences in one pass."""
+        counts = [0] * len(BreakType)
+        confidence_sum = 0.0
+        
+        for b in breaks:
+            counts[b.kind] += 1
+            confidence_sum += b.confidence
+        
+        return counts, confidence_sum
 
 
 # Final Invariant
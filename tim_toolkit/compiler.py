@@ -10,4 +10,254 @@ from .validator import TIMValidator
 
 
 class TIMCompiler:
-    \"\"\"\n    Compiles micro-truths (jokes) into macro-truths (songs).\n    \n    Compression ratios:\n    - Joke (micro-truth): 1:100 (highly compressed)\n    - Song (macro-truth): 1:1,000 (fully unfolded)\n    \"\"\"\n    \n    def __init__(self):\n        \"\"\"Initialize compiler with sub-engines.\"\"\"\n        self.classifier = ExpectationBreakClassifier()\n        self.validator = TIMValidator()\n    \n    def compile_joke_to_song(self, joke: str, boundary_insight: str) -> Dict:\n        \"\"\"\n        Compile a joke into a song.\n        \n        Args:\n            joke: The micro-truth (compressed insight)\n            boundary_insight: The deeper pattern being revealed\n        \n        Returns:\n            Dict with song, diagnostics, and metadata\n        \"\"\"\n        # Validate non-coercion\n        is_valid, violations = self.validator.validate(joke)\n        \n        if not is_valid:\n            return {\n                \"status\": \"failed\",\n                \"error\": \"Joke contains coercive language\",\n                \"violations\": violations,\n                \"diagnostics\": [Diagnostic.COERCION_DETECTED.value]\n            }\n        \n        # Detect expectation breaks\n        breaks = self.classifier.detect_breaks(joke)\n        \n        if not breaks:\n            return {\n                \"status\": \"unstable\",\n                \"error\": \"No expectation breaks detected in joke\",\n                \"diagnostics\": [Diagnostic.UNDER_COMPRESSION.value]\n            }\n        \n        # Generate song verses\n        verses = self._generate_verses(joke, boundary_insight, breaks)\n        \n        # Generate chorus\n        chorus = self._generate_chorus(boundary_insight)\n        \n        # Generate bridge\n        bridge = self._generate_bridge(breaks, boundary_insight)\n        \n        # Assemble song\n        song = self._assemble_song(verses, chorus, bridge)\n        \n        # Calculate metrics\n        compression_ratio = len(song) / len(joke) if joke else 1.0\n        coherence_score = self._calculate_coherence(song, boundary_insight)\n        \n        # Build diagnostic report\n        report = DiagnosticValidator.build_report(\n            compression_ratio=compression_ratio,\n            coherence_score=coherence_score,\n            breaks_detected=len(breaks),\n            coercion_detected=False,\n            semantic_surprise=len(breaks) > 0,\n            metadata={\n                \"break_types\": list(set(b.break_type for b in breaks)),\n                \"invitation_score\": self.validator.calculate_invitation_score(song)\n            }\n        )\n        \n        return {\n            \"status\": report.status.value,\n            \"song\": song,\n            \"verses\": verses,\n            \"chorus\": chorus,\n            \"bridge\": bridge,\n            \"diagnostics\": report.to_dict(),\n            \"compression_ratio\": compression_ratio,\n            \"coherence_score\": coherence_score,\n            \"breaks_detected\": len(breaks)\n        }\n    \n    def _generate_verses(self, joke: str, insight: str, breaks: List) -> List[str]:\n        \"\"\"\n        Generate song verses from joke and breaks.\n        \n        Verses expand the compressed joke into narrative form.\n        \"\"\"\n        verses = []\n        \n        # Verse 1: Setup (establish the expectation)\n        verse1 = f\"\"\"Verse 1:\nThe question posed, the path laid clear,\nExpectation whispered in the ear,\n{joke.split('?')[0] if '?' in joke else joke[:50]}...\nThe answer seemed so very near.\"\"\"\n        verses.append(verse1)\n        \n        # Verse 2: Expectation Break (the surprise)\n        if breaks:\n            primary_break = breaks[0]\n            verse2 = f\"\"\"Verse 2:\nBut then a turn, a twist of fate,\nThe answer came, it would not wait,\n{primary_break.content}\nThe insight opened up the gate.\"\"\"\n            verses.append(verse2)\n        \n        # Verse 3: Boundary Insight (the deeper meaning)\n        verse3 = f\"\"\"Verse 3:\nFor in this truth, a pattern shows,\nWhere understanding deeply flows,\n{insight}\nThis is the wisdom that it knows.\"\"\"\n        verses.append(verse3)\n        \n        # Verse 4: Reflection (what it means)\n        verse4 = f\"\"\"Verse 4:\nSo when you hear this tale once more,\nRemember what lies at its core,\nThe joke was just the outer shell,\nThe truth within is what to tell.\"\"\"\n        verses.append(verse4)\n        \n        return verses\n    \n    def _generate_chorus(self, insight: str) -> str:\n        \"\"\"\n        Generate chorus that captures the core insight.\n        \n        Chorus is repeated, so it must be memorable and invitational.\n        \"\"\"\n        chorus = f\"\"\"Chorus:\nTruth moves, it never stays still,\nIt breaks what we thought we will,\n{insight}\nThis is the deeper thrill.\"\"\"\n        \n        return chorus\n    \n    def _generate_bridge(self, breaks: List, insight: str) -> str:\n        \"\"\"\n        Generate bridge that connects joke to deeper meaning.\n        \n        Bridge is where the transformation happens.\n        \"\"\"\n        bridge_type = breaks[0].break_type if breaks else \"paradox\"\n        \n        bridge = f\"\"\"Bridge:\nThe {bridge_type} was the key,\nThat set the hidden meaning free,\nFrom compressed joke to flowing song,\nThe truth was there all along.\"\"\"\n        \n        return bridge\n    \n    def _assemble_song(self, verses: List[str], chorus: str, bridge: str) -> str:\n        \"\"\"\n        Assemble verses, chorus, and bridge into complete song.\n        \"\"\"\n        song_parts = [\n            verses[0],\n            chorus,\n            verses[1] if len(verses) > 1 else \"\",\n            chorus,\n            verses[2] if len(verses) > 2 else \"\",\n            bridge,\n            chorus,\n            verses[3] if len(verses) > 3 else \"\",\n            \"Outro:\\nThe truth keeps moving, ever on,\\nFrom dusk until the breaking dawn.\"\n        ]\n        \n        return \"\\n\\n\".join([p for p in song_parts if p])\n    \n    def _calculate_coherence(self, song: str, insight: str) -> float:\n        \"\"\"\n        Calculate coherence score (0.0 to 1.0).\n        \n        Measures how well the song maintains the boundary insight.\n        \"\"\"\n        # Check if insight appears in song\n        if insight.lower() in song.lower():\n            base_score = 0.8\n        else:\n            base_score = 0.5\n        \n        # Check for narrative flow\n        verse_count = song.count(\"Verse\")\n        chorus_count = song.count(\"Chorus\")\n        \n        if verse_count >= 3 and chorus_count >= 2:\n            base_score += 0.15\n        \n        # Check for coherence violations\n        violations = self.validator._check_coherence(song)\n        if violations:\n            base_score -= len(violations) * 0.1\n        \n        return max(0.0, min(1.0, base_score))\n    \n    def compile_batch(self, jokes_with_insights: List[Dict]) -> List[Dict]:\n        \"\"\"\n        Compile multiple jokes into songs.\n        \n        Args:\n            jokes_with_insights: List of {\"joke\": str, \"insight\": str}\n        \n        Returns:\n            List of compiled results\n        \"\"\"\n        results = []\n        \n        for item in jokes_with_insights:\n            result = self.compile_joke_to_song(item[\"joke\"], item[\"insight\"])\n            results.append(result)\n        \n        return results\n    \n    def estimate_expansion_ratio(self, joke: str) -> float:\n        \"\"\"\n        Estimate how much a joke will expand when compiled.\n        \n        Based on joke length and break density.\n        \"\"\"\n        breaks = self.classifier.detect_breaks(joke)\n        break_count = len(breaks)\n        word_count = len(joke.split())\n        \n        # Base expansion: 10x\n        base_expansion = 10.0\n        \n        # Adjust for break density\n        break_density = (break_count / max(word_count, 1)) * 100\n        expansion_factor = 1.0 + (break_density / 10.0)\n        \n        return base_expansion * expansion_factor\n\n\n# Final Invariant\n\"\"\"\nCompilation transforms:\n- Compressed (joke) → Expanded (song)\n- Surprise → Understanding\n- Micro-truth → Macro-truth\n\nIf it coerces, it fails.\nIf it moves, it teaches.\n\"\"\"\n
+    """
+    Compiles micro-truths (jokes) into macro-truths (songs).
+    
+    Compression ratios:
+    - Joke (micro-truth): 1:100 (highly compressed)
+    - Song (macro-truth): 1:1,000 (fully unfolded)
+    """
+    
+    def __init__(self):
+        """Initialize compiler with sub-engines."""
+        self.classifier = ExpectationBreakClassifier()
+        self.validator = TIMValidator()
+    
+    def compile_joke_to_song(self, joke: str, boundary_insight: str) -> Dict:
+        """
+        Compile a joke into a song.
+        
+        Args:
+            joke: The micro-truth (compressed insight)
+            boundary_insight: The deeper pattern being revealed
+        
+        Returns:
+            Dict with song, diagnostics, and metadata
+        """
+        # Validate non-coercion
+        is_valid, violations = self.validator.validate(joke)
+        
+        if not is_valid:
+            return {
+                "status": "failed",
+                "error": "Joke contains coercive language",
+                "violations": violations,
+                "diagnostics": [Diagnostic.COERCION_DETECTED.value]
+            }
+        
+        # Detect expectation breaks
+        breaks = self.classifier.detect_breaks(joke)
+        
+        if not breaks:
+            return {
+                "status": "unstable",
+                "error": "No expectation breaks detected in joke",
+                "diagnostics": [Diagnostic.UNDER_COMPRESSION.value]
+            }
+        
+        # Generate song verses
+        verses = self._generate_verses(joke, boundary_insight, breaks)
+        
+        # Generate chorus
+        chorus = self._generate_chorus(boundary_insight)
+        
+        # Generate bridge
+        bridge = self._generate_bridge(breaks, boundary_insight)
+        
+        # Assemble song
+        song = self._assemble_song(verses, chorus, bridge)
+        
+        # Calculate metrics
+        compression_ratio = len(song) / len(joke) if joke else 1.0
+        coherence_score = self._calculate_coherence(song, boundary_insight)
+        
+        # Build diagnostic report
+        report = DiagnosticValidator.build_report(
+            compression_ratio=compression_ratio,
+            coherence_score=coherence_score,
+            breaks_detected=len(breaks),
+            coercion_detected=False,
+            semantic_surprise=len(breaks) > 0,
+            metadata={
+                "break_types": list(set(b.break_type for b in breaks)),
+                "invitation_score": self.validator.calculate_invitation_score(song)
+            }
+        )
+        
+        return {
+            "status": report.status.value,
+            "song": song,
+            "verses": verses,
+            "chorus": chorus,
+            "bridge": bridge,
+            "diagnostics": report.to_dict(),
+            "compression_ratio": compression_ratio,
+            "coherence_score": coherence_score,
+            "breaks_detected": len(breaks)
+        }
+    
+    def _generate_verses(self, joke: str, insight: str, breaks: List) -> List[str]:
+        """
+        Generate song verses from joke and breaks.
+        
+        Verses expand the compressed joke into narrative form.
+        """
+        verses = []
+        
+        # Verse 1: Setup (establish the expectation)
+        verse1 = f"""Verse 1:
+The question posed, the path laid clear,
+Expectation whispered in the ear,
+{joke.split('?')[0] if '?' in joke else joke[:50]}...
+The answer seemed so very near."""
+        verses.append(verse1)
+        
+        # Verse 2: Expectation Break (the surprise)
+        if breaks:
+            primary_break = breaks[0]
+            verse2 = f"""Verse 2:
+But then a turn, a twist of fate,
+The answer came, it would not wait,
+{primary_break.content}
+The insight opened up the gate."""
+            verses.append(verse2)
+        
+        # Verse 3: Boundary Insight (the deeper meaning)
+        verse3 = f"""Verse 3:
+For in this truth, a pattern shows,
+Where understanding deeply flows,
+{insight}
+This is the wisdom that it knows."""
+        verses.append(verse3)
+        
+        # Verse 4: Reflection (what it means)
+        verse4 = f"""Verse 4:
+So when you hear this tale once more,
+Remember what lies at its core,
+The joke was just the outer shell,
+The truth within is what to tell."""
+        verses.append(verse4)
+        
+        return verses
+    
+    def _generate_chorus(self, insight: str) -> str:
+        """
+        Generate chorus that captures the core insight.
+        
+        Chorus is repeated, so it must be memorable and invitational.
+        """
+        chorus = f"""Chorus:
+Truth moves, it never stays still,
+It breaks what we thought we will,
+{insight}
+This is the deeper thrill."""
+        
+        return chorus
+    
+    def _generate_bridge(self, breaks: List, insight: str) -> str:
+        """
+        Generate bridge that connects joke to deeper meaning.
+        
+        Bridge is where the transformation happens.
+        """
+        bridge_type = breaks[0].break_type if breaks else "paradox"
+        
+        bridge = f"""Bridge:
+The {bridge_type} was the key,
+That set the hidden meaning free,
+From compressed joke to flowing song,
+The truth was there all along."""
+        
+        return bridge
+    
+    def _assemble_song(self, verses: List[str], chorus: str, bridge: str) -> str:
+        """
+        Assemble verses, chorus, and bridge into complete song.
+        """
+        song_parts = [
+            verses[0],
+            chorus,
+            verses[1] if len(verses) > 1 else "",
+            chorus,
+            verses[2] if len(verses) > 2 else "",
+            bridge,
+            chorus,
+            verses[3] if len(verses) > 3 else "",
+            "Outro:\nThe truth keeps moving, ever on,\nFrom dusk until the breaking dawn."
+        ]
+        
+        return "\n\n".join([p for p in song_parts if p])
+    
+    def _calculate_coherence(self, song: str, insight: str) -> float:
+        """
+        Calculate coherence score (0.0 to 1.0).
+        
+        Measures how well the song maintains the boundary insight.
+        """
+        # Check if insight appears in song
+        if insight.lower() in song.lower():
+            base_score = 0.8
+        else:
+            base_score = 0.5
+        
+        # Check for narrative flow
+        verse_count = song.count("Verse")
+        chorus_count = song.count("Chorus")
+        
+        if verse_count >= 3 and chorus_count >= 2:
+            base_score += 0.15
+        
+        # Check for coherence violations
+        violations = self.validator._check_coherence(song)
+        if violations:
+            base_score -= len(violations) * 0.1
+        
+        return max(0.0, min(1.0, base_score))
+    
+    def compile_batch(self, jokes_with_insights: List[Dict]) -> List[Dict]:
+        """
+        Compile multiple jokes into songs.
+        
+        Args:
+            jokes_with_insights: List of {"joke": str, "insight": str}
+        
+        Returns:
+            List of compiled results
+        """
+        results = []
+        
+        for item in jokes_with_insights:
+            result = self.compile_joke_to_song(item["joke"], item["insight"])
+            results.append(result)
+        
+        return results
+    
+    def estimate_expansion_ratio(self, joke: str) -> float:
+        """
+        Estimate how much a joke will expand when compiled.
+        
+        Based on joke length and break density.
+        """
+        break_count = self.classifier.count_breaks(joke)
+        word_count = len(joke.split())
+        
+        # Base expansion: 10x
+        base_expansion = 10.0
+        
+        # Adjust for break density
+        break_density = (break_count / max(word_count, 1)) * 100
+        expansion_factor = 1.0 + (break_density / 10.0)
+        
+        return base_expansion * expansion_factor
+
+
+# Final Invariant
+"""
+Compilation transforms:
+- Compressed (joke) → Expanded (song)
+- Surprise → Understanding
+- Micro-truth → Macro-truth
+
+If it coerces, it fails.
+If it moves, it teaches.
+"""
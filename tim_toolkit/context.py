@@ -0,0 +1,52 @@
+"""
+Truth-in-Motion (TIM) Engine - Context Module
+Precomputed views of content shared across classifier and validator calls.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+# re.IGNORECASE also matches these to "i"; casefold() alone does not
+_DOTTED_I = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def fold_case(text: str) -> str:
+    """
+    Fold text for literal prescreens of case-insensitive patterns.
+
+    Plain lower() misses letters re.IGNORECASE treats as ASCII, such as
+    the long s, which matches "s".
+    """
+    return text.translate(_DOTTED_I).casefold()
+
+
+@dataclass(slots=True)
+class ContentContext:
+    """
+    Per-call view of a piece of content.
+
+    Built once at the engine entry point and passed to score methods so
+    they don't each re-split, re-lowercase or re-validate the same text.
+    """
+    text: str
+    lower: str  # fold_case(text)
+    word_count: int
+    validation: Optional[Tuple[bool, List[str]]] = None
+
+    @classmethod
+    def from_content(cls, content: str) -> "ContentContext":
+        """Build a context for content."""
+        return cls(text=content, lower=fold_case(content), word_count=len(content.split()))
+
+    def check(self, content: str) -> None:
+        """Raise ValueError if this context was built for other content."""
+        if self.text != content:
+            raise ValueError("ContentContext was built for different content")
+
+
+# Final Invariant
+"""
+Read once.
+Let every lens share the same view.
+"""
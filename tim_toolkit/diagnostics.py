@@ -3,10 +3,16 @@ Truth-in-Motion (TIM) Engine - Diagnostics Module
 Defines validation states and diagnostic flags for creative compression.
 """
 
+import json
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON serialization
+    orjson = None
+
 
 class Status(Enum):
     """Output status indicators."""
@@ -29,7 +35,12 @@ class Diagnostic(Enum):
     BOUNDARY_INSIGHT_WEAK = "BoundaryInsightWeak"
 
 
-@dataclass
+# Serialized values, looked up by member instead of through Enum.value
+_DIAGNOSTIC_VALUES = {d: d.value for d in Diagnostic}
+_STATUS_VALUES = {s: s.value for s in Status}
+
+
+@dataclass(slots=True)
 class DiagnosticReport:
     """
     Diagnostic report for a compilation.
@@ -64,14 +75,26 @@ class DiagnosticReport:
     def to_dict(self) -> dict:
         """Serialize diagnostic report."""
         return {
-            "status": self.status.value,
-            "diagnostics": [d.value for d in self.diagnostics],
+            "status": _STATUS_VALUES[self.status],
+            "diagnostics": [_DIAGNOSTIC_VALUES[d] for d in self.diagnostics],
             "compression_ratio": self.compression_ratio,
             "coherence_score": self.coherence_score,
             "breaks_detected": self.breaks_detected,
             "coercion_detected": self.coercion_detected,
             "metadata": self.metadata,
         }
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize diagnostic report as compact UTF-8 JSON.
+        
+        Uses orjson when installed, otherwise the standard json module.
+        """
+        if orjson is not None:
+            # Metadata may carry int keys, which the stdlib json stringifies
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        
+        return json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False).encode()
 
 
 class DiagnosticValidator:
@@ -172,27 +195,37 @@ class DiagnosticValidator:
         )
 
 
+# Fixed header of a diagnostic log, filled with one %-format per report
+_LOG_TEMPLATE = (
+    "Status: %s\n"
+    "Compression Ratio: %.2f\n"
+    "Coherence Score: %.2f\n"
+    "Breaks Detected: %s\n"
+    "Coercion Detected: %s"
+)
+
+
 class DiagnosticLogger:
     """Logs and reports diagnostic information."""
     
     @staticmethod
     def log_report(report: DiagnosticReport) -> str:
         """Generate human-readable diagnostic log."""
-        lines = [
-            f"Status: {report.status.value}",
-            f"Compression Ratio: {report.compression_ratio:.2f}",
-            f"Coherence Score: {report.coherence_score:.2f}",
-            f"Breaks Detected: {report.breaks_detected}",
-            f"Coercion Detected: {report.coercion_detected}",
-        ]
+        log = _LOG_TEMPLATE % (
+            _STATUS_VALUES[report.status],
+            report.compression_ratio,
+            report.coherence_score,
+            report.breaks_detected,
+            report.coercion_detected,
+        )
         
         if report.diagnostics:
-            lines.append(f"Diagnostics: {', '.join(d.value for d in report.diagnostics)}")
+            log += f"\nDiagnostics: {', '.join(_DIAGNOSTIC_VALUES[d] for d in report.diagnostics)}"
         
         if report.metadata:
-            lines.append(f"Metadata: {report.metadata}")
+            log += f"\nMetadata: {report.metadata}"
         
-        return "\n".join(lines)
+        return log
     
     @staticmethod
     def suggest_refinement(report: DiagnosticReport) -> Optional[str]:
@@ -6,6 +6,30 @@ Validates content against non-coercion and compression requirements.
 import re
 from typing import List, Dict, Tuple, Optional
 from .diagnostics import Diagnostic
+from .context import ContentContext, fold_case
+
+
+# Invitational language, precompiled once so scoring skips the re module cache
+_INVITATIONAL_PATTERN = re.compile(
+    "|".join([
+        r"(?:you\s+)?(?:might|could|may)\s+(?:consider|explore|think)",
+        r"(?:one\s+)?(?:way|perspective|approach)",
+        r"(?:perhaps|maybe|possibly)",
+        r"(?:if\s+)?(?:you\s+)?(?:choose|prefer|decide)",
+        r"(?:worth|interesting|worth\s+exploring)",
+    ]),
+    re.IGNORECASE
+)
+
+
+def _compile_alternation(terms: List[str]) -> re.Pattern:
+    """Compile terms into one alternation, used to prescreen a whole category."""
+    return re.compile("|".join(f"(?:{p})" for p in terms), re.IGNORECASE)
+
+
+def _compile_terms(terms: List[str]) -> Tuple[re.Pattern, ...]:
+    """Compile each term on its own, case-insensitively."""
+    return tuple(re.compile(p, re.IGNORECASE) for p in terms)
 
 
 class TIMValidator:
@@ -58,25 +82,66 @@ class TIMValidator:
         r"(?:according\s+to|research\s+shows|studies\s+prove)",
     ]
     
-    def __init__(self):
-        """Initialize validator with compiled patterns."""
-        self.coercion_patterns = [re.compile(p, re.IGNORECASE) for p in self.COERCION_TERMS]
-        self.emotional_patterns = [re.compile(p, re.IGNORECASE) for p in self.EMOTIONAL_MANIPULATION_TERMS]
-        self.pressure_patterns = [re.compile(p, re.IGNORECASE) for p in self.PRESSURE_TERMS]
-        self.authority_patterns = [re.compile(p, re.IGNORECASE) for p in self.AUTHORITY_TERMS]
+    # Class-level so construction is free; import pays the compile cost once
+    coercion_patterns = _compile_terms(COERCION_TERMS)
+    emotional_patterns = _compile_terms(EMOTIONAL_MANIPULATION_TERMS)
+    pressure_patterns = _compile_terms(PRESSURE_TERMS)
+    authority_patterns = _compile_terms(AUTHORITY_TERMS)
+    
+    # One alternation per category, searched once before its terms are.
+    # It only prescreens: leftmost matching hides a term that overlaps an
+    # earlier one, so each term is still confirmed with its own pattern.
+    _combined_coercion = _compile_alternation(COERCION_TERMS)
+    _combined_emotional = _compile_alternation(EMOTIONAL_MANIPULATION_TERMS)
+    _combined_pressure = _compile_alternation(PRESSURE_TERMS)
+    _combined_authority = _compile_alternation(AUTHORITY_TERMS)
     
-    def validate(self, content: str, constraints: Dict = None) -> Tuple[bool, List[str]]:
+    # A contradiction is an affirming word followed anywhere later by a negating one
+    _AFFIRMING_TERMS = ("true", "real", "correct")
+    _NEGATING_TERMS = ("false", "fake", "wrong")
+    _INCOMPLETE_ENDINGS = ("but", "however", "yet", "because")
+    
+    # Literal substrings at least one of which every term above requires;
+    # content containing none of them cannot match and skips the scans
+    _violation_anchors = (
+        "you", "must", "obviously", "clearly", "undeniably", "disagree",
+        "argue", "believ", "accept", "understand", "know", "admit",
+        "confess", "acknowledge", "ashamed", "guilty", "afraid", "scared",
+        "followers", "supporters", "can't", "won't", "everyone", "now",
+        "immediately", "today", "time", "offer", "opportunity", "wait",
+        "delay", "hesitate", "late", "hurry", "rush", "fast", "truth",
+        "says", "claims", "fact", "according", "shows", "prove",
+    )
+    
+    def validate(
+        self,
+        content: str,
+        constraints: Dict = None,
+        context: Optional[ContentContext] = None
+    ) -> Tuple[bool, List[str]]:
         """
         Validate content against constraints.
         
+        With a context and default constraints, the result is stored on
+        the context and reused by later calls.
+        
         Returns: (is_valid, list_of_violations)
         """
+        if context is not None:
+            context.check(content)
+        
+        cacheable = constraints is None and context is not None
+        if cacheable and context.validation is not None:
+            is_valid, violations = context.validation
+            return is_valid, list(violations)
+        
         if constraints is None:
             constraints = {"non_coercion": True}
         
         violations = []
+        lowered = context.lower if context is not None else fold_case(content)
         
-        if constraints.get("non_coercion", True):
+        if constraints.get("non_coercion", True) and self._has_violation_anchor(lowered):
             coercion_violations = self._check_coercion(content)
             violations.extend(coercion_violations)
             
@@ -90,19 +155,42 @@ class TIMValidator:
             violations.extend(authority_violations)
         
         if constraints.get("coherence", True):
-            coherence_violations = self._check_coherence(content)
+            coherence_violations = self._check_coherence(content, lowered)
             violations.extend(coherence_violations)
         
+        if cacheable:
+            context.validation = (len(violations) == 0, list(violations))
+        
         return len(violations) == 0, violations
     
+    def _has_violation_anchor(self, lowered: str) -> bool:
+        """Cheap substring prescreen before running the term scans."""
+        return any(a in lowered for a in self._violation_anchors)
+    
+    @staticmethod
+    def _first_matches(
+        combined: re.Pattern,
+        patterns: Tuple[re.Pattern, ...],
+        content: str
+    ) -> List[str]:
+        """
+        Return the first match of each term, in term-list order.
+        
+        Content with no match for the category alternation is rejected
+        in a single scan; otherwise each term stops at its first hit.
+        """
+        if combined.search(content) is None:
+            return []
+        
+        matches = (pattern.search(content) for pattern in patterns)
+        return [m.group() for m in matches if m]
+    
     def _check_coercion(self, content: str) -> List[str]:
         """Check for coercive language."""
         violations = []
         
-        for pattern in self.coercion_patterns:
-            matches = pattern.findall(content)
-            if matches:
-                violations.append(f"Coercive language detected: {matches[0]}")
+        for match in self._first_matches(self._combined_coercion, self.coercion_patterns, content):
+            violations.append(f"Coercive language detected: {match}")
         
         return violations
     
@@ -110,10 +198,8 @@ class TIMValidator:
         """Check for emotional manipulation."""
         violations = []
         
-        for pattern in self.emotional_patterns:
-            matches = pattern.findall(content)
-            if matches:
-                violations.append(f"Emotional manipulation detected: {matches[0]}")
+        for match in self._first_matches(self._combined_emotional, self.emotional_patterns, content):
+            violations.append(f"Emotional manipulation detected: {match}")
         
         return violations
     
@@ -121,10 +207,8 @@ class TIMValidator:
         """Check for pressure/urgency tactics."""
         violations = []
         
-        for pattern in self.pressure_patterns:
-            matches = pattern.findall(content)
-            if matches:
-                violations.append(f"Pressure/urgency tactic detected: {matches[0]}")
+        for match in self._first_matches(self._combined_pressure, self.pressure_patterns, content):
+            violations.append(f"Pressure/urgency tactic detected: {match}")
         
         return violations
     
@@ -132,39 +216,39 @@ class TIMValidator:
         """Check for unsupported authority claims."""
         violations = []
         
-        for pattern in self.authority_patterns:
-            matches = pattern.findall(content)
-            if matches:
-                violations.append(f"Authority claim detected: {matches[0]}")
+        for match in self._first_matches(self._combined_authority, self.authority_patterns, content):
+            violations.append(f"Authority claim detected: {match}")
         
         return violations
     
-    def _check_coherence(self, content: str) -> List[str]:
+    def _check_coherence(self, content: str, lowered: Optional[str] = None) -> List[str]:
         """Check for coherence issues."""
         violations = []
-        
-        # Check for contradictions
-        contradiction_pattern = re.compile(
-            r"(?:true|real|correct).*?(?:false|fake|wrong)",
-            re.IGNORECASE | re.DOTALL
+        if lowered is None:
+            lowered = fold_case(content)
+        
+        # Check for contradictions: the earliest-ending affirming word must end
+        # at or before the last negating word starts (linear, no regex scan)
+        affirm_end = min(
+            (i + len(t) for t in self._AFFIRMING_TERMS if (i := lowered.find(t)) != -1),
+            default=None
         )
-        
-        if contradiction_pattern.search(content):
+        if affirm_end is not None and max(lowered.rfind(t) for t in self._NEGATING_TERMS) >= affirm_end:
             violations.append("Potential contradiction detected")
         
         # Check for incomplete thoughts
-        if content.endswith(("but", "however", "yet", "because")):
+        if content.endswith(self._INCOMPLETE_ENDINGS):
             violations.append("Incomplete thought at end of content")
         
         return violations
     
-    def suggest_reframe(self, content: str) -> Optional[str]:
+    def suggest_reframe(self, content: str, context: Optional[ContentContext] = None) -> Optional[str]:
         """
         Suggest how to reframe content to be non-coercive.
         
         Returns suggestion or None if already valid.
         """
-        is_valid, violations = self.validate(content)
+        is_valid, violations = self.validate(content, context=context)
         
         if is_valid:
             return None
@@ -189,18 +273,18 @@ class TIMValidator:
         
         return None
     
-    def calculate_coercion_score(self, content: str) -> float:
+    def calculate_coercion_score(self, content: str, context: Optional[ContentContext] = None) -> float:
         """
         Calculate coercion score (0.0 = non-coercive, 1.0 = highly coercive).
         """
-        is_valid, violations = self.validate(content)
+        is_valid, violations = self.validate(content, context=context)
         
         if is_valid:
             return 0.0
         
         # Each violation adds to the score
         violation_count = len(violations)
-        word_count = len(content.split())
+        word_count = context.word_count if context is not None else len(content.split())
         
         # Normalize: violations per 100 words
         coercion_density = (violation_count / max(word_count, 1)) * 100
@@ -208,34 +292,41 @@ class TIMValidator:
         # Cap at 1.0
         return min(1.0, coercion_density)
     
-    def calculate_invitation_score(self, content: str) -> float:
+    def calculate_invitation_score(self, content: str, context: Optional[ContentContext] = None) -> float:
         """
         Calculate invitation score (0.0 = demanding, 1.0 = highly invitational).
         
         Inverse of coercion score with bonus for invitational language.
         """
-        coercion_score = self.calculate_coercion_score(content)
+        _, invitation_score = self.score_coercion_and_invitation(content, context=context)
         
-        # Check for invitational language
-        invitational_patterns = [
-            r"(?:you\s+)?(?:might|could|may)\s+(?:consider|explore|think)",
-            r"(?:one\s+)?(?:way|perspective|approach)",
-            r"(?:perhaps|maybe|possibly)",
-            r"(?:if\s+)?(?:you\s+)?(?:choose|prefer|decide)",
-            r"(?:worth|interesting|worth\s+exploring)",
-        ]
+        return invitation_score
+    
+    def score_coercion_and_invitation(
+        self,
+        content: str,
+        context: Optional[ContentContext] = None
+    ) -> Tuple[float, float]:
+        """
+        Calculate coercion and invitation scores together.
         
-        invitational_count = 0
-        for pattern in invitational_patterns:
-            invitational_count += len(re.findall(pattern, content, re.IGNORECASE))
+        Content is validated, split and lowercased once for both scores.
         
-        word_count = len(content.split())
-        invitational_density = (invitational_count / max(word_count, 1)) * 100
+        Returns: (coercion_score, invitation_score)
+        """
+        if context is None:
+            context = ContentContext.from_content(content)
+        
+        coercion_score = self.calculate_coercion_score(content, context=context)
+        
+        # Check for invitational language
+        invitational_count = len(_INVITATIONAL_PATTERN.findall(content))
+        invitational_density = (invitational_count / max(context.word_count, 1)) * 100
         
         # Combine: non-coercive + invitational
         invitation_score = (1.0 - coercion_score) * (1.0 + min(0.5, invitational_density / 100))
         
-        return min(1.0, invitation_score)
+        return coercion_score, min(1.0, invitation_score)
 
 
 # Final Invariant